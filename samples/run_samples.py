@@ -1,4 +1,3 @@
-import json
 import os
 import sys
 from pathlib import Path
@@ -6,7 +5,7 @@ from pathlib import Path
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.pipeline import run_extraction
+from src.pipeline import iter_modules_json, run_extraction
 
 
 SAMPLE_URLS = [
@@ -22,28 +21,9 @@ def main() -> None:
     output_dir.mkdir(parents=True, exist_ok=True)
 
     result = run_extraction(SAMPLE_URLS, max_pages=60, max_depth=3)
-    payload = {
-        "modules": [
-            {
-                "name": m.name,
-                "description": m.description,
-                "confidence": m.confidence,
-                "source_urls": m.source_urls,
-                "submodules": [
-                    {
-                        "name": sm.name,
-                        "description": sm.description,
-                        "confidence": sm.confidence,
-                        "source_urls": sm.source_urls,
-                    }
-                    for sm in m.submodules
-                ],
-            }
-            for m in result.modules
-        ]
-    }
     target = output_dir / "sample_output.json"
-    target.write_text(json.dumps(payload, indent=2, ensure_ascii=False), encoding="utf-8")
+    with open(target, "wb") as f:
+        f.writelines(iter_modules_json(result.modules))
     print(f"Wrote {target}")
 
 
@@ -1,5 +1,6 @@
 """FastAPI endpoint for Pulse module extraction."""
 import json
+import os
 from typing import List, Optional
 
 from fastapi import FastAPI, HTTPException
@@ -8,7 +9,7 @@ from pydantic import BaseModel, HttpUrl
 
 from .cache import PersistentCache
 from .crawler import Crawler
-from .pipeline import run_extraction
+from .pipeline import module_to_dict, run_extraction
 
 app = FastAPI(
     title="Pulse Module Extraction API",
@@ -68,47 +69,25 @@ def extract_modules(request: ExtractionRequest):
         if not url_strings:
             raise HTTPException(status_code=400, detail="At least one URL is required")
         
-        # Setup persistent cache if enabled
-        persistent_cache = None
-        if request.use_cache:
-            persistent_cache = PersistentCache()
-        
         # Run extraction
         result = run_extraction(
             url_strings,
             max_pages=request.max_pages or 40,
             max_depth=request.max_depth or 3,
+            use_cache=bool(request.use_cache),
+            workers=os.cpu_count(),
         )
         
-        # Build response payload
-        payload = {
-            "modules": [
-                {
-                    "name": m.name,
-                    "description": m.description,
-                    "confidence": m.confidence,
-                    "source_urls": m.source_urls,
-                    "submodules": [
-                        {
-                            "name": sm.name,
-                            "description": sm.description,
-                            "confidence": sm.confidence,
-                            "source_urls": sm.source_urls,
-                        }
-                        for sm in m.submodules
-                    ],
-                }
-                for m in result.modules
-            ]
-        }
-        
         stats = {
             "total_modules": len(result.modules),
             "total_submodules": sum(len(m.submodules) for m in result.modules),
             "urls_processed": len(url_strings),
         }
         
-        return ExtractionResponse(modules=payload["modules"], stats=stats)
+        return ExtractionResponse(
+            modules=[module_to_dict(m) for m in result.modules],
+            stats=stats,
+        )
     
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Extraction failed: {str(e)}")
@@ -117,18 +96,18 @@ def extract_modules(request: ExtractionRequest):
 @app.get("/cache/stats")
 def cache_stats():
     """Get cache statistics."""
-    cache = PersistentCache()
-    return {
-        "cached_items": cache.size(),
-        "cache_dir": str(cache.cache_dir),
-    }
+    with PersistentCache() as cache:
+        return {
+            "cached_items": cache.size(),
+            "cache_dir": str(cache.cache_dir),
+        }
 
 
 @app.post("/cache/clear")
 def clear_cache():
     """Clear the persistent cache."""
-    cache = PersistentCache()
-    cache.clear()
+    with PersistentCache() as cache:
+        cache.clear()
     return {"message": "Cache cleared successfully"}
 
 
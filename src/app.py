@@ -1,11 +1,11 @@
-import json
 import os
 from typing import List
 
+import orjson
 import streamlit as st
 
 # Use absolute imports so running via `streamlit run src/app.py` works
-from src.pipeline import run_extraction
+from src.pipeline import module_to_dict, run_extraction
 from src.utils import dedupe_preserve_order
 
 
@@ -37,31 +37,12 @@ if st.button("Run Extraction", type="primary"):
     else:
         with st.spinner("Crawling and extracting..."):
             result = run_extraction(urls, max_pages=max_pages, max_depth=max_depth)
-        payload = {
-            "modules": [
-                {
-                    "name": m.name,
-                    "description": m.description,
-                    "confidence": m.confidence,
-                    "source_urls": m.source_urls,
-                    "submodules": [
-                        {
-                            "name": sm.name,
-                            "description": sm.description,
-                            "confidence": sm.confidence,
-                            "source_urls": sm.source_urls,
-                        }
-                        for sm in m.submodules
-                    ],
-                }
-                for m in result.modules
-            ]
-        }
+        payload = {"modules": [module_to_dict(m) for m in result.modules]}
         st.success(f"Extraction complete. Found {len(result.modules)} modules.")
         st.json(payload)
         st.download_button(
             label="Download JSON",
-            data=json.dumps(payload, indent=2, ensure_ascii=False),
+            data=orjson.dumps(payload, option=orjson.OPT_INDENT_2),
             file_name="pulse_modules.json",
             mime="application/json",
         )
@@ -1,62 +1,109 @@
 """Persistent caching for crawled pages."""
 import hashlib
-import json
 import logging
+import pickle
+import sqlite3
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
+
+import zstandard as zstd
 
 from .crawler import Page
+from .models import Section
 from .utils import get_logger
 
 logger = get_logger()
 
 
 class PersistentCache:
-    """Disk-based cache for crawled pages."""
+    """Disk-based cache for crawled pages, backed by a single SQLite database."""
+
+    DB_NAME = "cache.db"
+    # Bump when section extraction changes so stale parses are not reused
+    SECTIONS_VERSION = 2
 
     def __init__(self, cache_dir: str = "cache"):
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.db_path = self.cache_dir / self.DB_NAME
+        self._conn = sqlite3.connect(self.db_path, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS pages"
+            "(key TEXT PRIMARY KEY, url TEXT, html BLOB, status INT)"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS sections(key TEXT PRIMARY KEY, blob BLOB)"
+        )
+        # HTML is stored zstd-compressed; doc pages typically shrink 5-10x
+        self._cctx = zstd.ZstdCompressor(level=6)
+        self._dctx = zstd.ZstdDecompressor()
 
     def _url_to_key(self, url: str) -> str:
-        """Convert URL to cache key (filename-safe hash)."""
+        """Convert URL to cache key (hash)."""
         return hashlib.sha256(url.encode()).hexdigest()
 
-    def _get_cache_path(self, url: str) -> Path:
-        """Get file path for cached URL."""
-        key = self._url_to_key(url)
-        return self.cache_dir / f"{key}.json"
-
     def get(self, url: str) -> Optional[Page]:
         """Retrieve cached page if available."""
-        cache_path = self._get_cache_path(url)
-        if not cache_path.exists():
-            return None
-
         try:
-            with open(cache_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            return Page(url=data["url"], html=data["html"], status=data["status"])
+            row = self._conn.execute(
+                "SELECT url, html, status FROM pages WHERE key = ?",
+                (self._url_to_key(url),),
+            ).fetchone()
+            if row is None:
+                return None
+            cached_url, html, status = row
+            return Page(url=cached_url, html=self._dctx.decompress(html).decode("utf-8"), status=status)
         except Exception as e:
             logger.warning("Failed to load cache for %s: %s", url, e)
             return None
 
     def set(self, url: str, page: Page) -> None:
         """Store page in cache."""
-        cache_path = self._get_cache_path(url)
         try:
-            data = {
-                "url": page.url,
-                "html": page.html,
-                "status": page.status,
-            }
-            with open(cache_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False)
+            blob = self._cctx.compress(page.html.encode("utf-8"))
+            self._conn.execute(
+                "INSERT OR REPLACE INTO pages (key, url, html, status) VALUES (?, ?, ?, ?)",
+                (self._url_to_key(url), page.url, blob, page.status),
+            )
         except Exception as e:
             logger.warning("Failed to cache %s: %s", url, e)
 
+    def _html_to_key(self, html: str) -> str:
+        """Convert page content to a sections cache key."""
+        digest = hashlib.sha256(html.encode("utf-8", errors="replace")).hexdigest()
+        return f"v{self.SECTIONS_VERSION}:{digest}"
+
+    def get_sections(self, html: str) -> Optional[List[Section]]:
+        """Retrieve previously extracted sections for this exact HTML, if any."""
+        try:
+            row = self._conn.execute(
+                "SELECT blob FROM sections WHERE key = ?", (self._html_to_key(html),)
+            ).fetchone()
+            if row is None:
+                return None
+            return pickle.loads(self._dctx.decompress(row[0]))
+        except Exception as e:
+            logger.warning("Failed to load cached sections: %s", e)
+            return None
+
+    def set_sections(self, html: str, sections: List[Section]) -> None:
+        """Store extracted sections keyed by the HTML they came from."""
+        try:
+            blob = self._cctx.compress(pickle.dumps(sections, protocol=pickle.HIGHEST_PROTOCOL))
+            self._conn.execute(
+                "INSERT OR REPLACE INTO sections (key, blob) VALUES (?, ?)",
+                (self._html_to_key(html), blob),
+            )
+        except Exception as e:
+            logger.warning("Failed to cache sections: %s", e)
+
     def clear(self) -> None:
-        """Clear all cached files."""
+        """Clear all cached pages and sections."""
+        self._conn.execute("DELETE FROM pages")
+        self._conn.execute("DELETE FROM sections")
+        # Remove per-URL files left behind by the old JSON-file cache
         for cache_file in self.cache_dir.glob("*.json"):
             try:
                 cache_file.unlink()
@@ -66,5 +113,14 @@ class PersistentCache:
 
     def size(self) -> int:
         """Return number of cached items."""
-        return len(list(self.cache_dir.glob("*.json")))
+        return self._conn.execute("SELECT COUNT(*) FROM pages").fetchone()[0]
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self._conn.close()
+
+    def __enter__(self) -> "PersistentCache":
+        return self
 
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -1,14 +1,24 @@
+import io
 import re
-from typing import List, Tuple
+from itertools import islice
+from typing import Iterable, Iterator, List, Tuple
 
 from bs4 import BeautifulSoup
+from lxml import etree
 
 from .models import Section
 
 
+NOISE_TAGS = ("script", "style", "noscript", "header", "footer", "nav", "aside")
+BLOCK_TAGS = ("h1", "h2", "h3", "h4", "p", "li")
+
+_SENTENCE_BREAK_RE = re.compile(r"(?<=[.!?])\s+")
+
+
 def strip_noise(html: str) -> BeautifulSoup:
-    soup = BeautifulSoup(html, "html.parser")
-    for tag in soup(["script", "style", "noscript", "header", "footer", "nav", "aside"]):
+    # lxml is a hard dependency (iter_text_blocks parses with it directly)
+    soup = BeautifulSoup(html, "lxml")
+    for tag in soup(list(NOISE_TAGS)):
         tag.decompose()
     return soup
 
@@ -18,15 +28,65 @@ def extract_text_blocks(soup: BeautifulSoup) -> List[Tuple[str, str]]:
     Returns list of (tag_name, text) preserving order.
     """
     blocks: List[Tuple[str, str]] = []
-    for element in soup.find_all(["h1", "h2", "h3", "h4", "p", "li"]):
-        text = " ".join(element.get_text(" ", strip=True).split())
+    for element in soup.find_all(list(BLOCK_TAGS)):
+        # get_text strips each string; empty blocks are dropped before the
+        # split/join that collapses whitespace inside the text
+        text = element.get_text(" ", strip=True)
         if not text:
             continue
-        blocks.append((element.name, text))
+        blocks.append((element.name, " ".join(text.split())))
     return blocks
 
 
-def build_sections(blocks: List[Tuple[str, str]]) -> List[Section]:
+def iter_text_blocks(html: str) -> Iterator[Tuple[str, str]]:
+    """
+    Stream (tag_name, text) blocks straight from the parser, without building
+    a BeautifulSoup tree. Yields the same blocks as
+    ``extract_text_blocks(strip_noise(html))``.
+    """
+    if not html or not html.strip():
+        return
+    events = etree.iterparse(
+        io.BytesIO(html.encode("utf-8")),
+        events=("start", "end"),
+        tag=NOISE_TAGS + BLOCK_TAGS,
+        html=True,
+        encoding="utf-8",
+    )
+    skip_depth = 0
+    # Blocks can nest (<li><p>..</p></li>). Reserve a slot for each block in
+    # start order and flush them once the outermost open block closes.
+    open_slots: List[int] = []
+    pending: List[List[str]] = []
+    try:
+        for event, element in events:
+            if element.tag in NOISE_TAGS:
+                if event == "start":
+                    skip_depth += 1
+                else:
+                    skip_depth -= 1
+                    # Drop the subtree so enclosing blocks don't pick up its text
+                    element.clear(keep_tail=True)
+                continue
+            if skip_depth:
+                continue
+            if event == "start":
+                open_slots.append(len(pending))
+                pending.append([element.tag, ""])
+                continue
+
+            pending[open_slots.pop()][1] = " ".join(" ".join(element.itertext()).split())
+            if not open_slots:
+                for tag, text in pending:
+                    if text:
+                        yield tag, text
+                pending.clear()
+                element.clear(keep_tail=True)
+    except etree.XMLSyntaxError:
+        return
+
+
+def build_sections(blocks: Iterable[Tuple[str, str]]) -> List[Section]:
     level_map = {"h1": 1, "h2": 2, "h3": 3, "h4": 4}
     root: List[Section] = []
     stack: List[Section] = []
@@ -46,6 +106,7 @@ def build_sections(blocks: List[Tuple[str, str]]) -> List[Section]:
             # Text block: attach to nearest section
             if stack:
                 stack[-1].text += (" " + text) if stack[-1].text else text
+                stack[-1].word_count += len(text.split())
             else:
                 # No heading yet; treat as pseudo section
                 root.append(Section(level=1, title="Overview", text=text, children=[]))
@@ -53,10 +114,21 @@ def build_sections(blocks: List[Tuple[str, str]]) -> List[Section]:
 
 
 def extract_sections(html: str) -> List[Section]:
-    soup = strip_noise(html)
-    blocks = extract_text_blocks(soup)
-    sections = build_sections(blocks)
-    return sections
+    return build_sections(iter_text_blocks(html))
+
+
+def iter_sentences(text: str) -> Iterator[str]:
+    """Lazily split text on whitespace that follows sentence-ending punctuation."""
+    # Common for headings and list items: no terminator means one sentence,
+    # so skip the regex scan
+    if "." not in text and "!" not in text and "?" not in text:
+        yield text
+        return
+    start = 0
+    for match in _SENTENCE_BREAK_RE.finditer(text):
+        yield text[start : match.start()]
+        start = match.end()
+    yield text[start:]
 
 
 def summarize_text(text: str, max_sentences: int = 2) -> str:
@@ -64,16 +136,19 @@ def summarize_text(text: str, max_sentences: int = 2) -> str:
     if not text or not text.strip():
         return ""
     
-    # Split by sentence endings
-    sentences = re.split(r"(?<=[.!?])\s+", text.strip())
-    # Filter out very short fragments that aren't real sentences
-    sentences = [s for s in sentences if len(s.split()) >= 3]
+    # Take the first sentences, skipping very short fragments that aren't real
+    # sentences; stops scanning as soon as enough have been found
+    sentences = list(
+        islice(
+            (s for s in iter_sentences(text.strip()) if len(s.split()) >= 3),
+            max_sentences,
+        )
+    )
     
     if sentences:
-        summary = " ".join(sentences[:max_sentences]).strip()
+        summary = " ".join(sentences).strip()
         if summary:
             return summary
     
     # Fallback: first 200 characters
     return text[:200].strip() + ("..." if len(text) > 200 else "")
-
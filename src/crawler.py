@@ -1,13 +1,21 @@
+import asyncio
+import codecs
 import re
-from collections import deque
+from contextlib import nullcontext
 from dataclasses import dataclass
 from typing import Dict, List, Optional, Set
 from urllib.parse import urlparse
 
-import requests
-from bs4 import BeautifulSoup
+import aiohttp
+import lxml.html
+from lxml import etree
 
-from .utils import get_logger, is_same_domain, looks_like_binary, normalize_url
+from .utils import (
+    dedupe_preserve_order,
+    filter_links,
+    get_logger,
+    looks_like_binary,
+)
 
 # Import here to avoid circular dependency
 try:
@@ -17,8 +25,30 @@ except ImportError:
 
 logger = get_logger()
 
+# Collect anchor hrefs in C instead of walking the tree in Python. Pages are
+# parsed as UTF-8 bytes so XHTML encoding declarations don't trip up lxml.
+_HTML_PARSER = lxml.html.HTMLParser(encoding="utf-8")
+_HREF_XPATH = etree.XPath("//a/@href", smart_strings=False)
 
-@dataclass
+REQUEST_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.5",
+    "Accept-Encoding": "gzip, deflate",
+}
+
+
+def _charset(declared: Optional[str]) -> str:
+    """Return a usable codec name for a response charset, defaulting to UTF-8."""
+    if declared:
+        try:
+            return codecs.lookup(declared).name
+        except LookupError:
+            pass
+    return "utf-8"
+
+
+@dataclass(slots=True)
 class Page:
     url: str
     html: str
@@ -26,6 +56,15 @@ class Page:
 
 
 class Crawler:
+    # Non-content links: binary files, mailto/javascript/fragment-only hrefs,
+    # API endpoints and auth pages
+    SKIP_RE = re.compile(
+        r"\.(?:pdf|zip|docx?|xlsx?|pptx?|jpe?g|png|gif|svg|mp[34])$"
+        r"|^(?:mailto:|javascript:|#)"
+        r"|/api/|/log(?:in|out)|/sign(?:up|in)|/register",
+        re.IGNORECASE,
+    )
+
     def __init__(
         self,
         max_pages: int = 40,
@@ -33,6 +72,8 @@ class Crawler:
         timeout: int = 12,
         allow_cross_domain: bool = False,
         persistent_cache: Optional["PersistentCache"] = None,
+        max_concurrency: int = 20,
+        max_bytes: int = 512 * 1024,
     ) -> None:
         self.max_pages = max_pages
         self.max_depth = max_depth
@@ -40,8 +81,15 @@ class Crawler:
         self.allow_cross_domain = allow_cross_domain
         self.cache: Dict[str, Page] = {}
         self.persistent_cache = persistent_cache
+        self.max_concurrency = max_concurrency
+        self.max_bytes = max_bytes
 
-    def fetch(self, url: str) -> Page | None:
+    async def fetch(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        semaphore: Optional[asyncio.Semaphore] = None,
+    ) -> Page | None:
         # Check in-memory cache first
         if url in self.cache:
             return self.cache[url]
@@ -52,45 +100,49 @@ class Crawler:
             if cached_page:
                 self.cache[url] = cached_page
                 return cached_page
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-            "Accept-Language": "en-US,en;q=0.5",
-            "Accept-Encoding": "gzip, deflate",
-        }
+
         try:
-            resp = requests.get(url, headers=headers, timeout=self.timeout, allow_redirects=True)
-            resp.raise_for_status()
-        except requests.exceptions.Timeout:
+            async with semaphore or nullcontext():
+                async with session.get(
+                    url,
+                    timeout=aiohttp.ClientTimeout(total=self.timeout),
+                    allow_redirects=True,
+                ) as resp:
+                    resp.raise_for_status()
+                    # Decide from the headers before downloading the body
+                    content_type = resp.headers.get("Content-Type", "").lower()
+                    if looks_like_binary(content_type):
+                        logger.debug("Skip binary content %s (%s)", url, content_type)
+                        return None
+                    
+                    # Check if response is actually HTML
+                    if not content_type.startswith("text/html"):
+                        logger.debug("Skip non-HTML content %s (%s)", url, content_type)
+                        return None
+
+                    body = await self._read_capped(resp)
+                    html_text = body.decode(_charset(resp.charset), errors="replace")
+                    final_url = str(resp.url)
+                    status = resp.status
+        except asyncio.TimeoutError:
             logger.warning("Timeout fetching %s", url)
             return None
-        except requests.exceptions.TooManyRedirects:
+        except aiohttp.TooManyRedirects:
             logger.warning("Too many redirects for %s", url)
             return None
-        except requests.exceptions.HTTPError as e:
-            logger.warning("HTTP error %s for %s", e.response.status_code, url)
+        except aiohttp.ClientResponseError as e:
+            logger.warning("HTTP error %s for %s", e.status, url)
             return None
-        except requests.RequestException as exc:
+        except aiohttp.ClientError as exc:
             logger.warning("Fetch failed %s (%s)", url, exc)
             return None
         
-        content_type = resp.headers.get("Content-Type", "").lower()
-        if looks_like_binary(content_type):
-            logger.debug("Skip binary content %s (%s)", url, content_type)
-            return None
-        
-        # Check if response is actually HTML
-        if not content_type.startswith("text/html"):
-            logger.debug("Skip non-HTML content %s (%s)", url, content_type)
-            return None
-        
         # Validate HTML content (basic check)
-        html_text = resp.text
         if len(html_text) < 100:  # Too short to be useful
             logger.debug("Skip very short content %s (%d chars)", url, len(html_text))
             return None
         
-        page = Page(url=resp.url, html=html_text, status=resp.status_code)
+        page = Page(url=final_url, html=html_text, status=status)
         self.cache[url] = page
         
         # Store in persistent cache
@@ -99,70 +151,86 @@ class Crawler:
         
         return page
 
+    async def _read_capped(self, resp: aiohttp.ClientResponse) -> bytes:
+        """Read at most ``max_bytes`` of the body so huge pages can't exhaust memory."""
+        chunks: List[bytes] = []
+        size = 0
+        async for chunk in resp.content.iter_chunked(64 * 1024):
+            chunks.append(chunk)
+            size += len(chunk)
+            if size >= self.max_bytes:
+                logger.debug("Truncated %s at %d bytes", resp.url, self.max_bytes)
+                break
+        return b"".join(chunks)[: self.max_bytes]
+
     def extract_links(self, base_url: str, html: str) -> List[str]:
         """Extract and normalize links from HTML, filtering out common non-content URLs."""
         try:
-            soup = BeautifulSoup(html, "html.parser")
+            hrefs = _HREF_XPATH(lxml.html.fromstring(html.encode("utf-8"), parser=_HTML_PARSER))
         except Exception as e:
             logger.warning("Failed to parse HTML from %s: %s", base_url, e)
             return []
         
-        links: List[str] = []
-        skip_patterns = [
-            r"\.(pdf|zip|docx?|xlsx?|pptx?|jpg|jpeg|png|gif|svg|mp4|mp3)$",
-            r"mailto:",
-            r"javascript:",
-            r"#",
-            r"/api/",
-            r"/login",
-            r"/logout",
-            r"/signup",
-            r"/register",
-        ]
-        
-        for a in soup.find_all("a", href=True):
-            href = a["href"]
-            if not href or href.strip() == "#":
+        candidates: List[str] = []
+        for href in hrefs:
+            href = href.strip()
+            if not href or href == "#":
                 continue
             
             # Skip common non-content patterns
-            if any(re.search(pattern, href, re.IGNORECASE) for pattern in skip_patterns):
+            if self.SKIP_RE.search(href):
                 continue
             
-            normalized = normalize_url(base_url, href)
-            if not normalized:
-                continue
-            
-            if not self.allow_cross_domain and not is_same_domain(base_url, normalized):
-                continue
-            
-            links.append(normalized)
+            candidates.append(href)
         
-        return links
+        return filter_links(base_url, candidates, same_domain=not self.allow_cross_domain)
 
     def crawl(self, roots: List[str]) -> List[Page]:
-        queue = deque([(root, 0) for root in roots])
+        """Crawl breadth-first from the roots, fetching each depth level concurrently."""
+        return asyncio.run(self._crawl_async(roots))
+
+    async def _crawl_async(self, roots: List[str]) -> List[Page]:
         visited: Set[str] = set()
         pages: List[Page] = []
-
-        while queue and len(pages) < self.max_pages:
-            url, depth = queue.popleft()
-            if url in visited or depth > self.max_depth:
-                continue
-            visited.add(url)
-
-            parsed = urlparse(url)
-            if parsed.scheme not in {"http", "https"}:
-                continue
-
-            page = self.fetch(url)
-            if not page:
-                continue
-            pages.append(page)
-
-            links = self.extract_links(url, page.html)
-            for link in links:
-                if link not in visited:
-                    queue.append((link, depth + 1))
+        frontier = [
+            url for url in dedupe_preserve_order(roots)
+            if urlparse(url).scheme in {"http", "https"}
+        ][: self.max_pages]
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        # One pooled session per crawl: docs sites are usually a single host, so
+        # keep connections (and their TLS sessions) alive and cache DNS lookups
+        connector = aiohttp.TCPConnector(
+            limit=self.max_concurrency,
+            limit_per_host=8,
+            keepalive_timeout=30,
+            ttl_dns_cache=300,
+        )
+
+        async with aiohttp.ClientSession(connector=connector, headers=REQUEST_HEADERS) as session:
+            for depth in range(self.max_depth + 1):
+                if not frontier:
+                    break
+                visited.update(frontier)
+
+                results = await asyncio.gather(
+                    *(self.fetch(session, url, semaphore) for url in frontier),
+                    return_exceptions=True,
+                )
+
+                # Build the next level deduplicated and in discovery order; nav and
+                # footer links repeat on every page, so this shrinks it a lot
+                next_frontier: List[str] = []
+                enqueued: Set[str] = set()
+                for url, result in zip(frontier, results):
+                    if isinstance(result, Exception):
+                        logger.warning("Fetch failed %s (%s)", url, result)
+                        continue
+                    if not result:
+                        continue
+                    pages.append(result)
+                    for link in self.extract_links(url, result.html):
+                        if link not in visited and link not in enqueued:
+                            enqueued.add(link)
+                            next_frontier.append(link)
+                frontier = next_frontier[: self.max_pages - len(pages)]
         return pages
-
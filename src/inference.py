@@ -1,58 +1,112 @@
+import math
+import multiprocessing
 import re
+import sys
 from collections import defaultdict
-from typing import Dict, List, Set
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Set, Tuple
+
+from rapidfuzz import fuzz
 
 from .cleaner import extract_sections, summarize_text
 from .models import Module, Section, Submodule
-from .utils import dedupe_preserve_order, get_logger
+from .utils import get_logger
+
+if TYPE_CHECKING:
+    from .cache import PersistentCache
 
 logger = get_logger()
 
+# The streaming parser handles roughly 30 MB of HTML a second on one core,
+# while a cold worker pool takes 0.5-1 s to start (each worker imports lxml,
+# rapidfuzz and tldextract). Below this much HTML, serial parsing wins.
+PARALLEL_MIN_BYTES = 32 * 1024 * 1024
+# Aim for this many chunks per worker so uneven pages still balance out
+_CHUNKS_PER_WORKER = 4
+
+# Navigation/UI titles, recognised by their first word
+NOISE_FIRST_TOKENS = frozenset({
+    "home", "menu", "search", "login", "sign", "signup", "signin", "account",
+    "profile", "settings", "help", "support", "contact", "about", "privacy",
+    "terms", "cookie", "cookies", "skip", "jump", "back", "next", "previous",
+    "top", "bottom",
+})
+_FIRST_WORD_RE = re.compile(r"[a-z]+")
+_PAGE_NUMBER_RE = re.compile(r"page ?\d+|\d+ of \d+")
+
 
 def normalize_title(title: str) -> str:
     """Normalize titles for better grouping (lowercase, strip extra spaces)."""
-    return " ".join(title.lower().split())
+    # Interned: the same few titles ("overview", "introduction") recur on
+    # every page, and interned dict keys compare by identity
+    return sys.intern(" ".join(title.lower().split()))
 
 
 def is_valid_module_title(title: str) -> bool:
     """Filter out noise titles."""
-    if not title or len(title) < 3:
+    # Strip once so padded short titles ("  Hi ") fail the length check too
+    title_lower = title.strip().lower()
+    if len(title_lower) < 3:
         return False
     # Skip common navigation/UI elements
-    noise_patterns = [
-        r"^(home|menu|search|login|sign|account|profile|settings|help|support|contact|about|privacy|terms|cookie)",
-        r"^(skip|jump|back|next|previous|top|bottom)",
-        r"^(page \d+|page\d+|\d+ of \d+)",
-    ]
-    title_lower = title.lower().strip()
-    for pattern in noise_patterns:
-        if re.match(pattern, title_lower):
-            return False
-    return True
+    # The first word ends at any non-letter ("Sign-in", "Search…")
+    first_word = _FIRST_WORD_RE.match(title_lower)
+    if first_word and first_word.group() in NOISE_FIRST_TOKENS:
+        return False
+    return not _PAGE_NUMBER_RE.match(title_lower)
 
 
 def merge_similar_titles(titles: List[str], threshold: float = 0.8) -> Dict[str, str]:
     """
     Merge similar titles using simple string similarity.
     Returns mapping from original -> canonical title.
+
+    Similarity is RapidFuzz's normalized Indel ratio (2 * LCS / total length).
+    Similar titles are clustered (union-find) and each cluster maps to its
+    shortest title. Pairs whose lengths alone rule out reaching ``threshold``
+    are never compared.
     """
-    from difflib import SequenceMatcher
-    
-    canonical: Dict[str, str] = {}
-    for title in titles:
-        canonical[title] = title
-    
-    for i, title1 in enumerate(titles):
-        for title2 in titles[i + 1 :]:
-            norm1, norm2 = normalize_title(title1), normalize_title(title2)
-            similarity = SequenceMatcher(None, norm1, norm2).ratio()
-            if similarity >= threshold:
-                # Use the shorter, more specific title as canonical
-                canonical_title = title1 if len(title1) <= len(title2) else title2
-                canonical[title1] = canonical_title
-                canonical[title2] = canonical_title
-    
-    return canonical
+    norms = [normalize_title(title) for title in titles]
+    lengths = [len(norm) for norm in norms]
+    parent = list(range(len(titles)))
+    score_cutoff = threshold * 100
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    # Titles that normalize identically (case/whitespace variants) match with
+    # ratio 1.0; group them in one hash pass and compare only one of each
+    first_by_norm: Dict[str, int] = {}
+    for i, norm in enumerate(norms):
+        first = first_by_norm.setdefault(norm, i)
+        if first != i:
+            parent[i] = first
+
+    # ratio = 2*M / (len1 + len2) <= 2*len1 / (len1 + len2) for len1 <= len2, so
+    # once titles are sorted by length the first too-long partner ends the scan.
+    order = sorted(first_by_norm.values(), key=lengths.__getitem__)
+    for pos, i in enumerate(order):
+        for j in order[pos + 1 :]:
+            total = lengths[i] + lengths[j]
+            if total and 2.0 * lengths[i] / total < threshold:
+                break
+            if find(i) == find(j):
+                continue
+            if fuzz.ratio(norms[i], norms[j], score_cutoff=score_cutoff):
+                parent[find(j)] = find(i)
+
+    # Use the shortest (first on ties) title of each cluster as canonical
+    shortest: Dict[int, int] = {}
+    for i in range(len(titles)):
+        root = find(i)
+        if root not in shortest or len(titles[i]) < len(titles[shortest[root]]):
+            shortest[root] = i
+
+    return {title: titles[shortest[find(i)]] for i, title in enumerate(titles)}
 
 
 def infer_from_sections(sections: List[Section], source_url: str) -> Dict[str, List[Section]]:
@@ -68,24 +122,25 @@ def infer_from_sections(sections: List[Section], source_url: str) -> Dict[str, L
 
 def module_description(section: Section) -> str:
     """Generate description from section content and immediate children."""
-    content = section.text.strip()
-    # Collect text from direct children (submodules)
-    child_texts = []
-    for child in section.children[:5]:  # Limit to top 5 to avoid noise
-        if child.text.strip():
-            child_texts.append(child.text.strip())
+    # Collect text from direct children (submodules); emptiness is checked
+    # with the precomputed word counts rather than by stripping text
+    child_texts = [
+        child.text.strip()
+        for child in section.children[:5]  # Limit to top 5 to avoid noise
+        if child.word_count
+    ]
     
-    full_content = " ".join([content] + child_texts)
-    if not full_content.strip():
+    if not section.word_count and not child_texts:
         # Fallback: use title if no content
         return f"Module for {section.title}."
     
+    full_content = " ".join([section.text.strip()] + child_texts)
     return summarize_text(full_content, max_sentences=3)
 
 
 def submodule_description(section: Section) -> str:
     """Generate description for submodule."""
-    if section.text.strip():
+    if section.word_count:
         return summarize_text(section.text, max_sentences=2)
     # Fallback to title-based description
     return f"Functionality related to {section.title}."
@@ -94,27 +149,105 @@ def submodule_description(section: Section) -> str:
 def calculate_confidence(section: Section, is_module: bool = True) -> float:
     """Calculate confidence score based on content quality."""
     base = 0.6 if is_module else 0.5
-    text_length = len(section.text.split())
-    
-    # Boost confidence for longer, more detailed content
-    length_bonus = min(0.2, text_length * 0.01)
-    
-    # Boost if has children (more structured)
-    structure_bonus = 0.1 if section.children else 0
-    
-    # Penalize very short titles
-    title_penalty = 0.1 if len(section.title.split()) < 2 else 0
-    
-    confidence = base + length_bonus + structure_bonus - title_penalty
+    # Longer content and child sections raise confidence; one-word titles lower it
+    confidence = (
+        base
+        + min(0.2, section.word_count * 0.01)
+        + (0.1 if section.children else 0)
+        - (0.1 if section.title_word_count < 2 else 0)
+    )
     return min(0.95, max(0.3, confidence))
 
 
-def infer_modules(pages: Dict[str, str]) -> List[Module]:
+def _extract_page_sections(item: Tuple[str, str]) -> Tuple[str, Optional[List[Section]]]:
+    """Parse one (url, html) pair; module-level so worker processes can run it."""
+    url, html = item
+    try:
+        return url, extract_sections(html)
+    except Exception as e:
+        logger.warning("Failed to extract sections from %s: %s", url, e)
+        return url, None
+
+
+def _mp_context() -> multiprocessing.context.BaseContext:
+    """
+    Start workers without forking the caller. The API calls in from its
+    threadpool, and a child forked while another thread holds a lock can
+    deadlock.
+    """
+    if "forkserver" not in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("spawn")
+    return multiprocessing.get_context("forkserver")
+
+
+def _parse_pages(
+    pages: Dict[str, str],
+    workers: Optional[int] = None,
+) -> Iterable[Tuple[str, Optional[List[Section]]]]:
+    """
+    Parse pages serially, or across up to ``workers`` processes when given
+    and there is enough HTML to pay for starting them.
+    """
+    items = list(pages.items())
+    if not workers or workers < 2:
+        return map(_extract_page_sections, items)
+    if sum(len(html) for html in pages.values()) < PARALLEL_MIN_BYTES:
+        return map(_extract_page_sections, items)
+    chunksize = max(1, len(items) // (workers * _CHUNKS_PER_WORKER))
+    # No more workers than there are chunks to hand out
+    workers = min(workers, math.ceil(len(items) / chunksize))
+    if workers < 2:
+        return map(_extract_page_sections, items)
+    try:
+        with ProcessPoolExecutor(max_workers=workers, mp_context=_mp_context()) as executor:
+            return list(executor.map(_extract_page_sections, items, chunksize=chunksize))
+    except (BrokenProcessPool, OSError) as e:
+        logger.warning("Parallel section extraction failed (%s); parsing serially", e)
+        return map(_extract_page_sections, items)
+
+
+def extract_all_sections(
+    pages: Dict[str, str],
+    section_cache: Optional["PersistentCache"] = None,
+    workers: Optional[int] = None,
+) -> List[Tuple[str, Optional[List[Section]]]]:
+    """
+    Extract sections for every page, in page order. Pages whose HTML is
+    already in ``section_cache`` are not parsed again. ``workers`` opts in to
+    parsing in worker processes (see ``infer_modules``).
+    """
+    results: Dict[str, Optional[List[Section]]] = {}
+    misses: Dict[str, str] = {}
+    for url, html in pages.items():
+        cached = section_cache.get_sections(html) if section_cache else None
+        if cached is None:
+            misses[url] = html
+        else:
+            results[url] = cached
+
+    for url, sections in _parse_pages(misses, workers):
+        results[url] = sections
+        if section_cache and sections is not None:
+            section_cache.set_sections(misses[url], sections)
+
+    return [(url, results[url]) for url in pages]
+
+
+def infer_modules(
+    pages: Dict[str, str],
+    section_cache: Optional["PersistentCache"] = None,
+    workers: Optional[int] = None,
+) -> List[Module]:
     """
     Infer modules and submodules from crawled pages.
+
+    Pages are parsed serially unless ``workers`` is given. Worker processes
+    are started with forkserver/spawn, which re-import the caller's
+    ``__main__`` module, so only pass ``workers`` from a script whose entry
+    code sits behind ``if __name__ == "__main__":``.
     
     Improved algorithm:
-    1. Extract sections from all pages
+    1. Extract sections from all pages (reusing ``section_cache`` when given)
     2. Group by normalized titles, merging similar ones
     3. Identify top-level modules (level 1-2 headings)
     4. Identify submodules (level 3-4 headings under modules)
@@ -129,9 +262,10 @@ def infer_modules(pages: Dict[str, str]) -> List[Module]:
     all_titles: List[str] = []
 
     # Extract sections from all pages
-    for url, html in pages.items():
+    for url, sections in extract_all_sections(pages, section_cache, workers):
+        if sections is None:
+            continue
         try:
-            sections = extract_sections(html)
             grouped = infer_from_sections(sections, url)
             for title, secs in grouped.items():
                 # Only consider level 1-2 sections as potential modules
@@ -141,7 +275,7 @@ def infer_modules(pages: Dict[str, str]) -> List[Module]:
                     section_sources[title].add(url)
                     all_titles.append(title)
         except Exception as e:
-            logger.warning("Failed to extract sections from %s: %s", url, e)
+            logger.warning("Failed to group sections from %s: %s", url, e)
             continue
 
     if not module_sections:
@@ -168,6 +302,9 @@ def infer_modules(pages: Dict[str, str]) -> List[Module]:
         
         # Use the first section as primary
         top_section = secs[0]
+        # Already unique; sorted for stable output. Shared by the module and
+        # all of its submodules rather than copied for each.
+        source_urls = sorted(merged_sources[title])
         
         # Collect unique submodules from all sections
         submodule_map: Dict[str, Submodule] = {}
@@ -179,7 +316,7 @@ def infer_modules(pages: Dict[str, str]) -> List[Module]:
                         submodule_map[child.title] = Submodule(
                             name=child.title,
                             description=submodule_description(child),
-                            source_urls=dedupe_preserve_order(list(merged_sources[title])),
+                            source_urls=source_urls,
                             confidence=calculate_confidence(child, is_module=False),
                         )
         
@@ -188,7 +325,7 @@ def infer_modules(pages: Dict[str, str]) -> List[Module]:
                 name=title,
                 description=module_description(top_section),
                 submodules=list(submodule_map.values()),
-                source_urls=dedupe_preserve_order(list(merged_sources[title])),
+                source_urls=source_urls,
                 confidence=calculate_confidence(top_section, is_module=True),
             )
         )
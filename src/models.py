@@ -2,15 +2,27 @@ from dataclasses import dataclass, field
 from typing import List
 
 
-@dataclass
+@dataclass(slots=True)
 class Section:
+    """
+    A heading and the text under it. ``word_count`` and ``title_word_count``
+    are derived from ``text`` and ``title`` at construction; code that changes
+    either afterwards must update the matching count (``build_sections`` does).
+    """
+
     level: int
     title: str
     text: str
     children: List["Section"] = field(default_factory=list)
+    word_count: int = field(default=0, init=False, repr=False, compare=False)
+    title_word_count: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.word_count = len(self.text.split())
+        self.title_word_count = len(self.title.split())
 
 
-@dataclass
+@dataclass(slots=True)
 class Submodule:
     name: str
     description: str
@@ -18,7 +30,7 @@ class Submodule:
     confidence: float
 
 
-@dataclass
+@dataclass(slots=True)
 class Module:
     name: str
     description: str
@@ -27,7 +39,7 @@ class Module:
     confidence: float
 
 
-@dataclass
+@dataclass(slots=True)
 class ExtractionResult:
     modules: List[Module]
 
@@ -1,11 +1,15 @@
 import argparse
-import json
-from typing import Dict, List, Optional
+import os
+import sys
+from contextlib import nullcontext
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+import orjson
 
 from .cache import PersistentCache
 from .crawler import Crawler
 from .inference import infer_modules
-from .models import ExtractionResult
+from .models import ExtractionResult, Module
 from .utils import dedupe_preserve_order, get_logger
 
 logger = get_logger()
@@ -16,32 +20,37 @@ def run_extraction(
     max_pages: int = 40,
     max_depth: int = 3,
     use_cache: bool = True,
+    workers: Optional[int] = None,
 ) -> ExtractionResult:
-    """Run the full extraction pipeline with error handling."""
+    """
+    Run the full extraction pipeline with error handling. ``workers`` is passed
+    to ``infer_modules``; leave it unset unless the calling script guards its
+    entry code with ``if __name__ == "__main__":``.
+    """
     if not urls:
         logger.error("No URLs provided")
         return ExtractionResult(modules=[])
     
     try:
-        persistent_cache = PersistentCache() if use_cache else None
-        crawler = Crawler(
-            max_pages=max_pages,
-            max_depth=max_depth,
-            persistent_cache=persistent_cache,
-        )
-        pages = crawler.crawl(dedupe_preserve_order(urls))
-        
-        if not pages:
-            logger.warning("No pages were successfully crawled")
-            return ExtractionResult(modules=[])
-        
-        html_map: Dict[str, str] = {page.url: page.html for page in pages if page.html}
-        
-        if not html_map:
-            logger.warning("No valid HTML content extracted")
-            return ExtractionResult(modules=[])
-        
-        modules = infer_modules(html_map)
+        with (PersistentCache() if use_cache else nullcontext()) as persistent_cache:
+            crawler = Crawler(
+                max_pages=max_pages,
+                max_depth=max_depth,
+                persistent_cache=persistent_cache,
+            )
+            pages = crawler.crawl(dedupe_preserve_order(urls))
+            
+            if not pages:
+                logger.warning("No pages were successfully crawled")
+                return ExtractionResult(modules=[])
+            
+            html_map: Dict[str, str] = {page.url: page.html for page in pages if page.html}
+            
+            if not html_map:
+                logger.warning("No valid HTML content extracted")
+                return ExtractionResult(modules=[])
+            
+            modules = infer_modules(html_map, section_cache=persistent_cache, workers=workers)
         logger.info("Extraction complete: %d modules found", len(modules))
         return ExtractionResult(modules=modules)
     except Exception as e:
@@ -49,6 +58,38 @@ def run_extraction(
         return ExtractionResult(modules=[])
 
 
+def module_to_dict(module: Module) -> Dict[str, Any]:
+    """Output representation of a module and its submodules."""
+    return {
+        "name": module.name,
+        "description": module.description,
+        "confidence": module.confidence,
+        "source_urls": module.source_urls,
+        "submodules": [
+            {
+                "name": sm.name,
+                "description": sm.description,
+                "confidence": sm.confidence,
+                "source_urls": sm.source_urls,
+            }
+            for sm in module.submodules
+        ],
+    }
+
+
+def iter_modules_json(modules: Iterable[Module]) -> Iterator[bytes]:
+    """
+    Encode ``{"modules": [...]}`` as JSON one module at a time, so the full
+    payload dict and output string never exist in memory at once.
+    """
+    yield b'{"modules": [\n'
+    for i, module in enumerate(modules):
+        if i:
+            yield b",\n"
+        yield orjson.dumps(module_to_dict(module), option=orjson.OPT_INDENT_2)
+    yield b"\n]}\n"
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Pulse module extraction agent")
     parser.add_argument(
@@ -60,36 +101,23 @@ def main() -> None:
     parser.add_argument("--max-pages", type=int, default=40, help="Maximum pages to crawl")
     parser.add_argument("--max-depth", type=int, default=3, help="Maximum crawl depth")
     parser.add_argument("--output", type=str, default="", help="Optional path to write JSON")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count(),
+        help="Worker processes for parsing large crawls (1 to parse serially)",
+    )
     args = parser.parse_args()
 
-    result = run_extraction(args.urls, max_pages=args.max_pages, max_depth=args.max_depth)
-    payload = {
-        "modules": [
-            {
-                "name": m.name,
-                "description": m.description,
-                "confidence": m.confidence,
-                "source_urls": m.source_urls,
-                "submodules": [
-                    {
-                        "name": sm.name,
-                        "description": sm.description,
-                        "confidence": sm.confidence,
-                        "source_urls": sm.source_urls,
-                    }
-                    for sm in m.submodules
-                ],
-            }
-            for m in result.modules
-        ]
-    }
-    json_str = json.dumps(payload, indent=2, ensure_ascii=False)
+    result = run_extraction(
+        args.urls, max_pages=args.max_pages, max_depth=args.max_depth, workers=args.workers
+    )
     if args.output:
-        with open(args.output, "w", encoding="utf-8") as f:
-            f.write(json_str)
+        with open(args.output, "wb") as f:
+            f.writelines(iter_modules_json(result.modules))
         logger.info("Wrote output to %s", args.output)
     else:
-        print(json_str)
+        sys.stdout.buffer.writelines(iter_modules_json(result.modules))
 
 
 if __name__ == "__main__":
@@ -1,62 +1,124 @@
 import logging
-import re
-from typing import Iterable, List, Set
-from urllib.parse import urlparse, urljoin
+from functools import lru_cache
+from typing import Dict, Iterable, List
+from urllib.parse import urljoin, urlsplit
 
 import tldextract
 
 LOGGER_NAME = "pulsegen"
 
+_FORMATTER = logging.Formatter("%(asctime)s | %(levelname)s | %(message)s", "%H:%M:%S")
+# Configured loggers by name; repeat calls skip logging's module lock
+_LOGGERS: Dict[str, logging.Logger] = {}
+
+_HTTP_SCHEMES = frozenset({"http", "https"})
+# Schemes common in real hrefs that can never normalize to an http(s) URL
+_NON_HTTP_PREFIXES = ("javascript:", "mailto:", "data:", "tel:", "ftp:")
+
+_BINARY_MAJOR_TYPES = frozenset({"image", "audio", "video"})
+_BINARY_APPLICATION_SUBTYPES = frozenset(
+    {"pdf", "zip", "octet-stream", "x-zip-compressed", "gzip"}
+)
+
+# Shared extractor built from the suffix list snapshot bundled with tldextract,
+# so lookups never trigger a network fetch or on-disk cache access
+_EXTRACT = tldextract.TLDExtract(
+    cache_dir=None, suffix_list_urls=(), fallback_to_snapshot=True
+)
+# The suffix trie is built lazily on first lookup; build it at import so the
+# cost is paid once in the parent, before any worker processes fork
+_EXTRACT("example.com")
+
 
 def get_logger(name: str = LOGGER_NAME) -> logging.Logger:
+    cached = _LOGGERS.get(name)
+    if cached is not None:
+        return cached
     logger = logging.getLogger(name)
     if not logger.handlers:
         handler = logging.StreamHandler()
-        formatter = logging.Formatter(
-            "%(asctime)s | %(levelname)s | %(message)s", "%H:%M:%S"
-        )
-        handler.setFormatter(formatter)
+        handler.setFormatter(_FORMATTER)
         logger.addHandler(handler)
         logger.setLevel(logging.INFO)
+    _LOGGERS[name] = logger
     return logger
 
 
 def normalize_url(base_url: str, link: str) -> str:
-    parsed_base = urlparse(base_url)
+    # Absolute links resolve the same on every page, so cache them by link
+    # alone; otherwise each page's base URL would make them separate entries
+    if link.startswith(("http://", "https://")):
+        base_url = ""
+    elif link[:11].lower().startswith(_NON_HTTP_PREFIXES):
+        return ""
+    return _normalize_url_impl(base_url, link)
+
+
+@lru_cache(maxsize=65536)
+def _normalize_url_impl(base_url: str, link: str) -> str:
     joined = urljoin(base_url, link)
-    parsed = urlparse(joined)
-    if parsed.scheme not in {"http", "https"}:
+    if urlsplit(joined).scheme not in _HTTP_SCHEMES:
         return ""
-    # Drop fragments
-    normalized = parsed._replace(fragment="").geturl()
-    return normalized
+    # Drop fragments by slicing, rather than rebuilding the URL from its parts
+    return joined.split("#", 1)[0]
+
+
+def normalize_urls(base_url: str, links: Iterable[str]) -> List[str]:
+    """
+    Batch form of ``normalize_url`` for all links found on one page. Links
+    that aren't http(s) are dropped rather than returned as "".
+    """
+    return [url for url in (normalize_url(base_url, link) for link in links) if url]
+
+
+def filter_links(base_url: str, links: Iterable[str], same_domain: bool = True) -> List[str]:
+    """
+    Normalize the links found on one page, drop repeats (keeping first-seen
+    order) and, with ``same_domain``, keep only links on the page's own
+    registered domain. Deduping first means each distinct URL has its domain
+    looked up once.
+    """
+    unique = dedupe_preserve_order(normalize_urls(base_url, links))
+    if not same_domain:
+        return unique
+    base_domain = registered_domain(base_url)
+    return [link for link in unique if registered_domain(link) == base_domain]
+
+
+def registered_domain(url: str) -> str:
+    """Return the registrable domain (e.g. ``example.co.uk``) of a URL."""
+    return _registered_domain(_hostname(url))
 
 
 def is_same_domain(url: str, other: str) -> bool:
-    def domain_parts(target: str) -> str:
-        ext = tldextract.extract(target)
-        return f"{ext.domain}.{ext.suffix}"
+    return registered_domain(url) == registered_domain(other)
 
-    return domain_parts(url) == domain_parts(other)
+
+def _hostname(url: str) -> str:
+    return urlsplit(url).hostname or url
+
+
+@lru_cache(maxsize=4096)
+def _registered_domain(host: str) -> str:
+    # Keyed by host, not URL: a crawl touches thousands of URLs but only a
+    # handful of hosts, so the suffix-list lookup runs once per host
+    ext = _EXTRACT(host)
+    return f"{ext.domain}.{ext.suffix}"
 
 
 def dedupe_preserve_order(items: Iterable[str]) -> List[str]:
-    seen: Set[str] = set()
-    result: List[str] = []
-    for item in items:
-        if item not in seen:
-            seen.add(item)
-            result.append(item)
-    return result
+    # dicts keep insertion order, and fromkeys dedupes in a single C-level pass
+    return list(dict.fromkeys(items))
 
 
 def looks_like_binary(content_type: str) -> bool:
     if not content_type:
         return False
-    return bool(
-        re.search(
-            r"(application/(pdf|zip|octet-stream)|image/|audio/|video/)", content_type,
-            re.IGNORECASE,
-        )
-    )
-
+    # Branch on the major type; only application/* needs its subtype checked
+    major, _, rest = content_type.partition("/")
+    major = major.strip().lower()
+    if major in _BINARY_MAJOR_TYPES:
+        return True
+    if major == "application":
+        return rest.partition(";")[0].strip().lower() in _BINARY_APPLICATION_SUBTYPES
+    return False
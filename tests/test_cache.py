@@ -0,0 +1,46 @@
+"""Unit tests for cache module."""
+import sqlite3
+
+import pytest
+
+from src.cache import PersistentCache
+from src.crawler import Page
+from src.models import Section
+
+
+class TestPersistentCache:
+    def test_roundtrip(self, tmp_path):
+        cache = PersistentCache(str(tmp_path))
+        page = Page(url="https://example.com/final", html="<p>Héllo</p>", status=200)
+        cache.set("https://example.com/page", page)
+        assert cache.get("https://example.com/page") == page
+
+    def test_miss_returns_none(self, tmp_path):
+        cache = PersistentCache(str(tmp_path))
+        assert cache.get("https://example.com/missing") is None
+
+    def test_size_and_clear(self, tmp_path):
+        cache = PersistentCache(str(tmp_path))
+        cache.set("https://example.com/a", Page(url="https://example.com/a", html="a", status=200))
+        cache.set("https://example.com/b", Page(url="https://example.com/b", html="b", status=200))
+        cache.set("https://example.com/a", Page(url="https://example.com/a", html="a2", status=200))
+        assert cache.size() == 2
+        cache.clear()
+        assert cache.size() == 0
+
+    def test_sections_roundtrip(self, tmp_path):
+        cache = PersistentCache(str(tmp_path))
+        html = "<h1>Title</h1><p>Body</p>"
+        sections = [Section(level=1, title="Title", text="Body")]
+        assert cache.get_sections(html) is None
+        cache.set_sections(html, sections)
+        assert cache.get_sections(html) == sections
+        assert cache.get_sections(html + " ") is None
+        cache.clear()
+        assert cache.get_sections(html) is None
+
+    def test_context_manager_closes_connection(self, tmp_path):
+        with PersistentCache(str(tmp_path)) as cache:
+            assert cache.size() == 0
+        with pytest.raises(sqlite3.ProgrammingError):
+            cache.size()
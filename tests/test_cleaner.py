@@ -5,6 +5,7 @@ from src.cleaner import (
     build_sections,
     extract_sections,
     extract_text_blocks,
+    iter_text_blocks,
     strip_noise,
     summarize_text,
 )
@@ -45,6 +46,26 @@ class TestExtractTextBlocks:
         assert blocks[0][0] == "p"
 
 
+class TestIterTextBlocks:
+    def test_matches_soup_extraction(self):
+        html = (
+            "<html><body><nav><h1>Menu</h1></nav><h1>Main <b>Title</b></h1>"
+            "<p>Hello <a>world</a><script>x()</script> again</p>"
+            "<ul><li>Item <p>nested</p></li></ul><footer><p>Footer</p></footer></body></html>"
+        )
+        blocks = list(iter_text_blocks(html))
+        assert blocks == extract_text_blocks(strip_noise(html))
+        assert blocks == [
+            ("h1", "Main Title"),
+            ("p", "Hello world again"),
+            ("li", "Item nested"),
+            ("p", "nested"),
+        ]
+
+    def test_handles_empty_html(self):
+        assert list(iter_text_blocks("")) == []
+
+
 class TestBuildSections:
     def test_builds_hierarchy(self):
         blocks = [
@@ -60,6 +81,22 @@ class TestBuildSections:
         assert len(sections[0].children) == 1
         assert sections[0].children[0].title == "Submodule 1.1"
 
+    def test_tracks_word_counts(self):
+        blocks = [("h1", "Getting Started"), ("p", "Install the app."), ("li", "Sign in")]
+        sections = build_sections(blocks)
+        assert sections[0].title_word_count == 2
+        assert sections[0].word_count == len(sections[0].text.split()) == 5
+
+    def test_counts_words_in_unnormalized_blocks(self):
+        sections = build_sections([("h1", "Intro"), ("p", "a   b"), ("p", "  ")])
+        assert sections[0].word_count == 2
+
+    def test_sections_are_slotted(self):
+        sections = build_sections([("h1", "Intro"), ("p", "Text")])
+        assert not hasattr(sections[0], "__dict__")
+        with pytest.raises(AttributeError):
+            sections[0].extra = 1
+
     def test_handles_text_without_headings(self):
         blocks = [("p", "Some text")]
         sections = build_sections(blocks)
@@ -0,0 +1,102 @@
+"""Unit tests for crawler module, run against a local HTTP server."""
+import threading
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.crawler import Crawler
+
+FILLER = "<p>" + "Documentation text for this page. " * 5 + "</p>"
+NAV = '<a href="/a">A</a><a href="/b">B</a>'
+
+
+def html_page(body: str) -> bytes:
+    return f"<html><body>{NAV}{body}{FILLER}</body></html>".encode("utf-8")
+
+
+# path -> (content type, body)
+ROUTES = {
+    "/": ("text/html; charset=utf-8", html_page(
+        '<a href="/a">A again</a><a href="/guide#setup">Setup</a>'
+        '<a href="/download">Download</a><a href="/data">Data</a>'
+    )),
+    "/a": ("text/html; charset=utf-8", html_page('<a href="/deep">Deep</a>')),
+    "/b": ("text/html; charset=utf-8", html_page('<a href="/">Home</a>')),
+    "/deep": ("text/html; charset=utf-8", html_page('<a href="/deeper">Deeper</a>')),
+    "/deeper": ("text/html; charset=utf-8", html_page("")),
+    "/guide": ("text/html; charset=utf-8", html_page("<h1>Guide</h1>")),
+    "/download": ("application/octet-stream", b"\x00" * 512),
+    "/data": ("application/json", b'{"items": []}' * 20),
+    "/big": ("text/html; charset=utf-8", html_page("x" * (64 * 1024))),
+}
+
+
+class Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.server.hits[self.path] += 1
+        if self.path not in ROUTES:
+            self.send_error(404)
+            return
+        content_type, body = ROUTES[self.path]
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    httpd.hits = Counter()
+    thread = threading.Thread(target=httpd.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    httpd.base = f"http://127.0.0.1:{httpd.server_address[1]}"
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def crawled_paths(server, pages):
+    return {page.url[len(server.base):] for page in pages}
+
+
+class TestCrawl:
+    def test_skips_binary_and_non_html(self, server):
+        pages = Crawler(max_pages=20, max_depth=1).crawl([server.base + "/"])
+        paths = crawled_paths(server, pages)
+        assert server.hits["/download"] == 1
+        assert server.hits["/data"] == 1
+        assert "/download" not in paths
+        assert "/data" not in paths
+
+    def test_caps_body_size(self, server):
+        pages = Crawler(max_depth=0, max_bytes=4096).crawl([server.base + "/big"])
+        assert len(pages) == 1
+        assert len(pages[0].html) == 4096
+
+    def test_respects_max_pages(self, server):
+        pages = Crawler(max_pages=3, max_depth=3).crawl([server.base + "/"])
+        assert len(pages) == 3
+        assert sum(server.hits.values()) == 3
+
+    def test_respects_max_depth(self, server):
+        assert crawled_paths(server, Crawler(max_depth=0).crawl([server.base + "/"])) == {"/"}
+        pages = Crawler(max_pages=20, max_depth=2).crawl([server.base + "/"])
+        paths = crawled_paths(server, pages)
+        assert "/deep" in paths
+        assert "/deeper" not in paths
+
+    def test_fetches_repeated_links_once(self, server):
+        Crawler(max_pages=20, max_depth=3).crawl([server.base + "/"])
+        assert server.hits["/a"] == 1
+        assert max(server.hits.values()) == 1
+
+    def test_follows_fragment_links(self, server):
+        pages = Crawler(max_pages=20, max_depth=1).crawl([server.base + "/"])
+        assert "/guide" in crawled_paths(server, pages)
+        assert "/guide#setup" not in server.hits
@@ -1,6 +1,10 @@
 """Unit tests for inference module."""
+from src.cache import PersistentCache
+from src.cleaner import build_sections, extract_sections
+from src import inference
 from src.inference import (
     calculate_confidence,
+    extract_all_sections,
     infer_modules,
     is_valid_module_title,
     merge_similar_titles,
@@ -27,9 +31,20 @@ class TestIsValidModuleTitle:
     def test_invalid_titles(self):
         assert not is_valid_module_title("")
         assert not is_valid_module_title("Hi")
+        assert not is_valid_module_title("   Hi   ")
         assert not is_valid_module_title("Login")
         assert not is_valid_module_title("Home")
         assert not is_valid_module_title("Skip to content")
+        assert not is_valid_module_title("Sign in")
+        assert not is_valid_module_title("Sign-in")
+        assert not is_valid_module_title("Sign-up")
+        assert not is_valid_module_title("Cookie-Settings")
+        assert not is_valid_module_title("Search…")
+        assert not is_valid_module_title("Page 2 of 5")
+
+    def test_matches_noise_on_whole_first_word(self):
+        assert is_valid_module_title("Backup and Restore")
+        assert is_valid_module_title("Topics")
 
 
 class TestMergeSimilarTitles:
@@ -45,6 +60,13 @@ class TestMergeSimilarTitles:
         # All should remain distinct
         assert len(set(mapping.values())) == len(titles)
 
+    def test_maps_cluster_to_shortest_title(self):
+        titles = ["User Management Guide", "User Management", "Billing"]
+        mapping = merge_similar_titles(titles, threshold=0.8)
+        assert mapping["User Management Guide"] == "User Management"
+        assert mapping["User Management"] == "User Management"
+        assert mapping["Billing"] == "Billing"
+
 
 class TestModuleDescription:
     def test_generates_from_content(self):
@@ -58,6 +80,10 @@ class TestModuleDescription:
         desc = module_description(section)
         assert "Test" in desc
 
+    def test_ignores_whitespace_only_children(self):
+        section = build_sections([("h1", "Test"), ("h2", "Child"), ("p", " \t ")])[0]
+        assert module_description(section) == "Module for Test."
+
 
 class TestSubmoduleDescription:
     def test_uses_text_when_available(self):
@@ -70,6 +96,10 @@ class TestSubmoduleDescription:
         desc = submodule_description(section)
         assert "Submodule" in desc
 
+    def test_fallback_for_whitespace_only_text(self):
+        section = build_sections([("h3", "Child Sec"), ("p", "   ")])[0]
+        assert submodule_description(section) == "Functionality related to Child Sec."
+
 
 class TestCalculateConfidence:
     def test_higher_confidence_for_longer_content(self):
@@ -105,6 +135,52 @@ class TestInferModules:
         assert len(modules) > 0
         assert any("User Management" in m.name for m in modules)
 
+    def test_parallel_matches_serial(self, monkeypatch):
+        mapped = []
+
+        class RecordingPool(inference.ProcessPoolExecutor):
+            def map(self, *args, **kwargs):
+                results = list(super().map(*args, **kwargs))
+                mapped.append(len(results))
+                return iter(results)
+
+        monkeypatch.setattr(inference, "ProcessPoolExecutor", RecordingPool)
+        pages = {
+            f"https://example.com/page{i}": f"""
+            <html><body>
+                <h1>Topic Number {i}</h1>
+                <p>Details about topic number {i} for readers.</p>
+                <h2>Nested Item {i}</h2>
+                <p>How nested item {i} works.</p>
+            </body></html>
+            """
+            for i in range(6)
+        }
+        # Serial by default, and when the HTML is too small to pay for a pool
+        expected = [(url, extract_sections(html)) for url, html in pages.items()]
+        assert extract_all_sections(pages) == expected
+        assert extract_all_sections(pages, workers=2) == expected
+        assert mapped == []
+
+        monkeypatch.setattr(inference, "PARALLEL_MIN_BYTES", 0)
+        parallel = extract_all_sections(pages, workers=2)
+        assert mapped == [len(pages)]
+        assert parallel == expected
+
+    def test_reuses_cached_sections(self, tmp_path, monkeypatch):
+        cache = PersistentCache(str(tmp_path))
+        html = "<html><body><h1>User Management</h1><p>Manage users.</p></body></html>"
+        first = infer_modules({"https://example.com": html}, section_cache=cache)
+        assert cache.get_sections(html) is not None
+
+        def fail_parse(pages, workers=None):
+            assert not pages, "cached pages were parsed again"
+            return []
+
+        monkeypatch.setattr(inference, "_parse_pages", fail_parse)
+        second = infer_modules({"https://example.com": html}, section_cache=cache)
+        assert [m.name for m in first] == [m.name for m in second]
+
     def test_handles_empty_pages(self):
         modules = infer_modules({})
         assert modules == []
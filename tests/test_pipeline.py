@@ -0,0 +1,24 @@
+"""Unit tests for pipeline module."""
+import json
+
+from src.models import Module, Submodule
+from src.pipeline import iter_modules_json, module_to_dict
+
+
+class TestIterModulesJson:
+    def test_encodes_modules(self):
+        modules = [
+            Module(
+                name="User Management",
+                description="Manage users.",
+                submodules=[Submodule("Create User", "Add a user.", ["https://example.com"], 0.5)],
+                source_urls=["https://example.com"],
+                confidence=0.8,
+            ),
+            Module(name="Billing", description="Plans.", submodules=[], source_urls=[], confidence=0.6),
+        ]
+        payload = json.loads(b"".join(iter_modules_json(modules)))
+        assert payload == {"modules": [module_to_dict(m) for m in modules]}
+
+    def test_handles_no_modules(self):
+        assert json.loads(b"".join(iter_modules_json([]))) == {"modules": []}
@@ -1,9 +1,11 @@
 """Unit tests for utils module."""
 from src.utils import (
     dedupe_preserve_order,
+    filter_links,
     is_same_domain,
     looks_like_binary,
     normalize_url,
+    normalize_urls,
 )
 
 
@@ -20,6 +22,38 @@ class TestNormalizeUrl:
 
     def test_rejects_non_http_schemes(self):
         assert normalize_url("https://example.com", "ftp://example.com/file") == ""
+        assert normalize_url("https://example.com", "JavaScript:void(0)") == ""
+        assert normalize_url("https://example.com", "tel:+15550100") == ""
+
+
+class TestNormalizeUrls:
+    def test_matches_normalize_url(self):
+        base = "https://example.com/docs/page"
+        links = [
+            "/a", "b#frag", "https://example.com/c?x=1#y", "../d", "e#x#y",
+            "ftp://example.com/f", "mailto:x@y.z",
+        ]
+        expected = [normalize_url(base, link) for link in links]
+        assert normalize_urls(base, links) == [url for url in expected if url]
+
+
+class TestFilterLinks:
+    def test_normalizes_dedupes_and_keeps_same_domain(self):
+        base = "https://docs.example.com/guide/"
+        links = [
+            "intro#top", "/guide/intro", "https://blog.example.com/post",
+            "https://other.org/page", "mailto:x@y.z", "intro",
+        ]
+        assert filter_links(base, links) == [
+            "https://docs.example.com/guide/intro",
+            "https://blog.example.com/post",
+        ]
+
+    def test_allows_cross_domain(self):
+        links = ["https://other.org/page", "https://other.org/page#a"]
+        assert filter_links("https://example.com", links, same_domain=False) == [
+            "https://other.org/page"
+        ]
 
 
 class TestIsSameDomain:
@@ -30,6 +64,10 @@ class TestIsSameDomain:
     def test_rejects_different_domains(self):
         assert not is_same_domain("https://example.com", "https://other.com")
 
+    def test_handles_multi_label_suffixes_and_ports(self):
+        assert is_same_domain("https://docs.example.co.uk:8443/a", "http://EXAMPLE.co.uk/b")
+        assert not is_same_domain("https://example.co.uk", "https://other.co.uk")
+
 
 class TestLooksLikeBinary:
     def test_detects_binary_types(self):
@@ -37,6 +75,11 @@ class TestLooksLikeBinary:
         assert looks_like_binary("image/png")
         assert looks_like_binary("application/zip")
 
+    def test_ignores_case_and_parameters(self):
+        assert looks_like_binary("Application/PDF; name=guide.pdf")
+        assert looks_like_binary(" IMAGE/SVG+XML")
+        assert looks_like_binary("application/gzip")
+
     def test_allows_text_types(self):
         assert not looks_like_binary("text/html")
         assert not looks_like_binary("application/json")